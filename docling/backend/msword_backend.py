@@ -1,9 +1,10 @@
 import logging
+import posixpath
+import zipfile
 from io import BytesIO
 from pathlib import Path
-from typing import Set, Union
+from typing import Dict, Optional, Set, Tuple, Union
 
-import docx
 from docling_core.types.doc import (
     DocItemLabel,
     DoclingDocument,
@@ -12,6 +13,8 @@ from docling_core.types.doc import (
     TableCell,
     TableData,
 )
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.styles import BabelFish
 from lxml import etree
 
 from docling.backend.abstract_backend import DeclarativeDocumentBackend
@@ -20,44 +23,142 @@ from docling.datamodel.document import InputDocument
 
 _log = logging.getLogger(__name__)
 
+# WordprocessingML main namespace
+_WNS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_XML_KEY = f"{{{_WNS}}}val"
+
+# Package relationships, which locate the main document and its styles part
+_RELS_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_RELATIONSHIP_TAG = f"{{{_RELS_NS}}}Relationship"
+
+# Parser for the package parts: no xml:id table and no whitespace-only text
+# nodes, which Word output is full of and which never reach the document
+_XML_PARSER = etree.XMLParser(
+    collect_ids=False, remove_blank_text=True, huge_tree=True, resolve_entities=False
+)
+
+# Compiled once at import. The numbering XPaths are evaluated on the w:numPr of
+# a paragraph, which is looked up first since most paragraphs have none.
+_NUMPR_PATH = f"{{{_WNS}}}pPr/{{{_WNS}}}numPr"
+_NUMID_XP = etree.XPath("string(w:numId/@w:val)", namespaces={"w": _WNS})
+_ILVL_XP = etree.XPath("string(w:ilvl/@w:val)", namespaces={"w": _WNS})
+_PSTYLE_XP = etree.XPath("string(w:pPr/w:pStyle/@w:val)", namespaces={"w": _WNS})
+
+# Inline images of a paragraph; images nested in another image (e.g. in a text
+# box) and the VML fallback of mc:AlternateContent are not counted twice
+_PICTURE_XP = etree.XPath(
+    ".//w:drawing[not(ancestor::w:drawing or ancestor::w:pict or ancestor::mc:Fallback)]"
+    " | .//w:pict[not(ancestor::w:drawing or ancestor::w:pict or ancestor::mc:Fallback)]",
+    namespaces={
+        "w": _WNS,
+        "mc": "http://schemas.openxmlformats.org/markup-compatibility/2006",
+    },
+)
+
+# Clark-notation tags of the body-level elements dispatched in walk_linear
+_BODY_TAG = f"{{{_WNS}}}body"
+_P_TAG = f"{{{_WNS}}}p"
+_TBL_TAG = f"{{{_WNS}}}tbl"
+
+# Text-bearing content of the runs of a paragraph, including hyperlink runs,
+# in document order (mirrors python-docx Paragraph.text)
+_RUN_CONTENT_XP = etree.XPath(
+    "(w:r | w:hyperlink/w:r)/*[self::w:t or self::w:tab or self::w:br or self::w:cr"
+    " or self::w:noBreakHyphen or self::w:ptab]",
+    namespaces={"w": _WNS},
+)
+_T_TAG = f"{{{_WNS}}}t"
+_BR_TAG = f"{{{_WNS}}}br"
+_BR_TYPE_KEY = f"{{{_WNS}}}type"
+_RUN_CONTENT_TEXT = {
+    f"{{{_WNS}}}tab": "\t",
+    f"{{{_WNS}}}ptab": "\t",
+    f"{{{_WNS}}}cr": "\n",
+    f"{{{_WNS}}}noBreakHyphen": "-",
+}
+
+# Paragraph styles which are mapped to plain paragraphs
+_PARA_STYLES = frozenset(
+    {
+        "Paragraph",
+        "Normal",
+        "Subtitle",
+        "Author",
+        "Default Text",
+        "List Paragraph",
+        "List Bullet",
+        "Quote",
+    }
+)
+
+# Labels used for every paragraph, resolved once instead of per element
+_LABEL_PARAGRAPH = DocItemLabel.PARAGRAPH
+_LABEL_TITLE = DocItemLabel.TITLE
+_GROUP_LIST = GroupLabel.LIST
+_GROUP_ORDERED_LIST = GroupLabel.ORDERED_LIST
+_GROUP_SECTION = GroupLabel.SECTION
+
+# Style definitions
+_STYLE_TAG = f"{{{_WNS}}}style"
+_STYLE_NAME_TAG = f"{{{_WNS}}}name"
+_STYLE_TYPE_KEY = f"{{{_WNS}}}type"
+_STYLE_ID_KEY = f"{{{_WNS}}}styleId"
+_STYLE_DEFAULT_KEY = f"{{{_WNS}}}default"
+# ST_OnOff values that mean true
+_ON_VALUES = ("1", "true", "on")
+
+# Table structure
+_TR_TAG = f"{{{_WNS}}}tr"
+_TC_TAG = f"{{{_WNS}}}tc"
+_TCPR_TAG = f"{{{_WNS}}}tcPr"
+_GRIDSPAN_TAG = f"{{{_WNS}}}gridSpan"
+_VMERGE_TAG = f"{{{_WNS}}}vMerge"
+
 
 class MsWordDocumentBackend(DeclarativeDocumentBackend):
 
     def __init__(self, in_doc: "InputDocument", path_or_stream: Union[BytesIO, Path]):
         super().__init__(in_doc, path_or_stream)
-        self.XML_KEY = (
-            "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val"
-        )
-        self.xml_namespaces = {
-            "w": "http://schemas.microsoft.com/office/word/2003/wordml"
-        }
         # self.initialise(path_or_stream)
         # Word file:
         self.path_or_stream = path_or_stream
         self.valid = False
         # Initialise the parents for the hierarchy
-        self.max_levels = 10
+        # Word has 9 heading levels and lists nest up to 9 levels below them
+        self.max_levels = 20
         self.level_at_new_list = None
-        self.parents = {}  # type: ignore
-        for i in range(-1, self.max_levels):
-            self.parents[i] = None
+        # Parent node per level. The trailing slot is never assigned and is read
+        # back as parents[-1], i.e. no parent (the document body).
+        self.parents = [None] * (self.max_levels + 1)  # type: ignore
+        # First level without a parent, kept in sync wherever parents change
+        self._current_level = 0
 
         self.level = 0
         self.listIter = 0
-
-        self.history = {
-            "names": [None],
-            "levels": [None],
-            "numids": [None],
-            "indents": [None],
-        }
-
-        self.docx_obj = None
+        # Paragraph style names by style id
+        self._style_name_by_id: Dict[str, Optional[str]] = {}
+        self._default_style_name: Optional[str] = None
+        # Parsed (label, level) per paragraph style name
+        self._label_cache: Dict[str, Tuple[str, Optional[int]]] = {}
+
+        # Style, level and numbering of the previous paragraph
+        self._prev_name = None
+        self._prev_level = None
+        self._prev_numid = None
+        self._prev_indent = None
+
+        self.docx_body = None
         try:
             if isinstance(self.path_or_stream, BytesIO):
-                self.docx_obj = docx.Document(self.path_or_stream)
+                # Reuse the in-memory buffer as is, only rewind it
+                self.path_or_stream.seek(0)
+                self.load_package(self.path_or_stream)
             elif isinstance(self.path_or_stream, Path):
-                self.docx_obj = docx.Document(str(self.path_or_stream))
+                # zipfile does many small reads while unpacking, serve them from a
+                # large buffer. The needed parts are parsed on load, so the file
+                # can be closed right away.
+                with open(self.path_or_stream, "rb", buffering=1 << 20) as f:
+                    self.load_package(f)
 
             self.valid = True
         except Exception as e:
@@ -65,6 +166,47 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
                 f"MsPowerpointDocumentBackend could not load document with hash {self.document_hash}"
             ) from e
 
+    def load_package(self, stream):
+        # Only the body and the style definitions are needed, read them straight
+        # from the package instead of materializing it with python-docx
+        with zipfile.ZipFile(stream) as package:
+            main_part = self.get_related_part(package, "", RT.OFFICE_DOCUMENT)
+            if main_part is None:
+                raise ValueError("DOCX package has no main document part")
+            with package.open(main_part) as f:
+                document = etree.parse(f, _XML_PARSER)
+
+            styles_part = self.get_related_part(package, main_part, RT.STYLES)
+            if styles_part is not None:
+                with package.open(styles_part) as f:
+                    self.load_paragraph_styles(etree.parse(f, _XML_PARSER).getroot())
+            else:
+                _log.debug("DOCX has no styles part, using Normal for all paragraphs")
+
+        self.docx_body = document.getroot().find(_BODY_TAG)
+        if self.docx_body is None:
+            raise ValueError("DOCX main document has no body")
+
+    def get_related_part(self, package, source, rel_type):
+        # Zip member name of the part a relationship of type rel_type points to,
+        # from the source part ("" for the package itself), or None
+        base_dir, name = posixpath.split(source)
+        try:
+            with package.open(posixpath.join(base_dir, "_rels", f"{name}.rels")) as f:
+                rels = etree.parse(f, _XML_PARSER).getroot()
+        except KeyError:
+            return None
+
+        for rel in rels.iterchildren(_RELATIONSHIP_TAG):
+            if rel.get("Type") != rel_type or rel.get("TargetMode") == "External":
+                continue
+            target = rel.get("Target", "")
+            # Targets are relative to the source part, or absolute in the package
+            if target.startswith("/"):
+                return posixpath.normpath(target).lstrip("/")
+            return posixpath.normpath(posixpath.join(base_dir, target))
+        return None
+
     def is_valid(self) -> bool:
         return self.valid
 
@@ -93,8 +235,8 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
 
         doc = DoclingDocument(name=self.file.stem or "file", origin=origin)
         if self.is_valid():
-            assert self.docx_obj is not None
-            doc = self.walk_linear(self.docx_obj.element.body, self.docx_obj, doc)
+            assert self.docx_body is not None
+            doc = self.walk_linear(self.docx_body, doc)
             return doc
         else:
             raise RuntimeError(
@@ -102,57 +244,27 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
             )
 
     def update_history(self, name, level, numid, ilevel):
-        self.history["names"].append(name)
-        self.history["levels"].append(level)
-
-        self.history["numids"].append(numid)
-        self.history["indents"].append(ilevel)
-
-    def prev_name(self):
-        return self.history["names"][-1]
-
-    def prev_level(self):
-        return self.history["levels"][-1]
-
-    def prev_numid(self):
-        return self.history["numids"][-1]
+        self._prev_name = name
+        self._prev_level = level
+        self._prev_numid = numid
+        self._prev_indent = ilevel
 
-    def prev_indent(self):
-        return self.history["indents"][-1]
-
-    def get_level(self) -> int:
-        """Return the first None index."""
-        for k, v in self.parents.items():
-            if k >= 0 and v == None:
-                return k
-        return 0
-
-    def walk_linear(self, body, docx_obj, doc) -> DoclingDocument:
-        for element in body:
-            tag_name = etree.QName(element).localname
-
-            # Check for Inline Images (drawings or blip elements)
-            found_drawing = etree.ElementBase.xpath(
-                element, ".//w:drawing", namespaces=self.xml_namespaces
-            )
-            found_pict = etree.ElementBase.xpath(
-                element, ".//w:pict", namespaces=self.xml_namespaces
-            )
+    def walk_linear(self, body, doc) -> DoclingDocument:
+        for element in body.iterchildren():
+            tag = element.tag
 
             # Check for Tables
-            if element.tag.endswith("tbl"):
+            if tag == _TBL_TAG:
                 try:
-                    self.handle_tables(element, docx_obj, doc)
+                    self.handle_tables(element, doc)
                 except Exception:
                     _log.debug("could not parse a table, broken docx table")
 
-            elif found_drawing or found_pict:
-                self.handle_pictures(element, docx_obj, doc)
             # Check for Text
-            elif tag_name in ["p"]:
-                self.handle_text_elements(element, docx_obj, doc)
+            elif tag == _P_TAG:
+                self.handle_text_elements(element, doc)
             else:
-                _log.debug(f"Ignoring element in DOCX with tag: {tag_name}")
+                _log.debug("Ignoring element in DOCX with tag: %s", tag)
         return doc
 
     def str_to_int(self, s, default=0):
@@ -163,62 +275,89 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
         except ValueError:
             return default
 
-    def get_numId_and_ilvl(self, paragraph):
-        # Access the XML element of the paragraph
-        numPr = paragraph._element.find(
-            ".//w:numPr", namespaces=paragraph._element.nsmap
+    def get_paragraph_text(self, element) -> str:
+        parts = []
+        for item in _RUN_CONTENT_XP(element):
+            tag = item.tag
+            if tag == _T_TAG:
+                parts.append(item.text or "")
+            elif tag == _BR_TAG:
+                # Only line breaks count, page and column breaks are dropped
+                if item.get(_BR_TYPE_KEY, "textWrapping") == "textWrapping":
+                    parts.append("\n")
+            else:
+                parts.append(_RUN_CONTENT_TEXT[tag])
+        return "".join(parts)
+
+    def get_numId_and_ilvl(self, element):
+        numPr = element.find(_NUMPR_PATH)
+        if numPr is None:
+            return None, None  # If the paragraph is not part of a list
+
+        # The compiled XPaths yield "" for a missing numId or ilvl
+        numId = _NUMID_XP(numPr)
+        ilvl = _ILVL_XP(numPr)
+        if not numId and not ilvl:
+            return None, None
+
+        return self.str_to_int(numId or None, default=None), self.str_to_int(
+            ilvl or None, default=None
         )
 
-        if numPr is not None:
-            # Get the numId element and extract the value
-            numId_elem = numPr.find("w:numId", namespaces=paragraph._element.nsmap)
-            ilvl_elem = numPr.find("w:ilvl", namespaces=paragraph._element.nsmap)
-            numId = numId_elem.get(self.XML_KEY) if numId_elem is not None else None
-            ilvl = ilvl_elem.get(self.XML_KEY) if ilvl_elem is not None else None
-
-            return self.str_to_int(numId, default=None), self.str_to_int(
-                ilvl, default=None
-            )
-
-        return None, None  # If the paragraph is not part of a list
-
-    def get_label_and_level(self, paragraph):
-        if paragraph.style is None:
-            return "Normal", None
-        label = paragraph.style.name
+    def load_paragraph_styles(self, styles):
+        # Same resolution as python-docx Paragraph.style: unknown or non-paragraph
+        # style ids fall back to the (last) default paragraph style, and names
+        # are reported by their UI name, e.g. "heading 1" as "Heading 1"
+        for style in styles.iterchildren(_STYLE_TAG):
+            # A style without w:type is a paragraph style
+            style_type = style.get(_STYLE_TYPE_KEY)
+            if style_type not in (None, "paragraph"):
+                continue
+            name_elem = style.find(_STYLE_NAME_TAG)
+            name = name_elem.get(_XML_KEY) if name_elem is not None else None
+            if name is not None:
+                name = BabelFish.internal2ui(name)
+            self._style_name_by_id.setdefault(style.get(_STYLE_ID_KEY), name)
+            if style_type is not None and style.get(_STYLE_DEFAULT_KEY) in _ON_VALUES:
+                self._default_style_name = name
+
+    def get_label_and_level(self, element):
+        label = self._style_name_by_id.get(
+            _PSTYLE_XP(element), self._default_style_name
+        )
         if label is None:
             return "Normal", None
-        if ":" in label:
-            parts = label.split(":")
-
-            if len(parts) == 2:
-                return parts[0], int(parts[1])
-
-        parts = label.split(" ")
-
-        if "Heading" in label and len(parts) == 2:
-            parts.sort()
-            label_str = ""
-            label_level = 0
-            if parts[0] == "Heading":
-                # print("{} - {}".format(parts[0], parts[1]))
-                label_str = parts[0]
-                label_level = self.str_to_int(parts[1], default=None)
-            if parts[1] == "Heading":
-                label_str = parts[1]
-                label_level = self.str_to_int(parts[0], default=None)
-            return label_str, label_level
-        else:
-            return label, None
-
-    def handle_text_elements(self, element, docx_obj, doc):
-        paragraph = docx.text.paragraph.Paragraph(element, docx_obj)
 
-        if paragraph.text is None:
-            # _log.warn(f"paragraph has text==None")
-            return
+        # Documents only use a handful of styles, parse each name once
+        cached = self._label_cache.get(label)
+        if cached is None:
+            cached = self.split_style_name(label)
+            self._label_cache[label] = cached
+        return cached
+
+    def split_style_name(self, label):
+        head, sep, tail = label.partition(":")
+        if sep and ":" not in tail:
+            level = self.str_to_int(tail, default=None)
+            if level is not None:
+                return head, level
+
+        if "Heading" not in label:
+            return label, None
 
-        text = paragraph.text.strip()
+        # Two words, one of them "Heading" and the other its level, in any order
+        first, sep, second = label.partition(" ")
+        if not sep or " " in second:
+            return label, None
+        if second == "Heading":
+            return "Heading", self.str_to_int(first, default=None)
+        if first == "Heading":
+            return "Heading", self.str_to_int(second, default=None)
+        # Other two word names with "Heading" in them are plain text
+        return "", 0
+
+    def handle_text_elements(self, element, doc):
+        text = self.get_paragraph_text(element).strip()
         # if len(text)==0 # keep empty paragraphs, they seperate adjacent lists!
 
         # Common styles for bullet and numbered lists.
@@ -227,9 +366,8 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
         # is_numbered = "List Bullet" not in paragraph.style.name
         is_numbered = False
 
-        p_style_name, p_level = self.get_label_and_level(paragraph)
-        numid, ilevel = self.get_numId_and_ilvl(paragraph)
-        # print("numid: {}, ilevel: {}, text: {}".format(numid, ilevel, text))
+        p_style_name, p_level = self.get_label_and_level(element)
+        numid, ilevel = self.get_numId_and_ilvl(element)
 
         if numid == 0:
             numid = None
@@ -238,7 +376,6 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
         if numid is not None and ilevel is not None:
             self.add_listitem(
                 element,
-                docx_obj,
                 doc,
                 p_style_name,
                 p_level,
@@ -248,74 +385,70 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
                 is_numbered,
             )
             self.update_history(p_style_name, p_level, numid, ilevel)
+            self.handle_inline_pictures(element, doc)
             return
-        elif numid is None and self.prev_numid() is not None:  # Close list
-            for key, val in self.parents.items():
-                if key >= self.level_at_new_list:
-                    self.parents[key] = None
+        elif numid is None and self._prev_numid is not None:  # Close list
+            self.parents[self.level_at_new_list :] = [None] * (
+                len(self.parents) - self.level_at_new_list
+            )
+            self._current_level = min(self._current_level, self.level_at_new_list)
             self.level = self.level_at_new_list - 1
             self.level_at_new_list = None
-        if p_style_name in ["Title"]:
-            for key, val in self.parents.items():
-                self.parents[key] = None
-            self.parents[0] = doc.add_text(
-                parent=None, label=DocItemLabel.TITLE, text=text
-            )
+        if p_style_name == "Title":
+            self.add_title(element, doc, p_style_name, p_level, text)
         elif "Heading" in p_style_name:
-            self.add_header(element, docx_obj, doc, p_style_name, p_level, text)
-
-        elif p_style_name in [
-            "Paragraph",
-            "Normal",
-            "Subtitle",
-            "Author",
-            "Default Text",
-            "List Paragraph",
-            "List Bullet",
-            "Quote",
-        ]:
-            level = self.get_level()
-            doc.add_text(
-                label=DocItemLabel.PARAGRAPH, parent=self.parents[level - 1], text=text
-            )
-
+            self.add_header(element, doc, p_style_name, p_level, text)
+        elif p_style_name in _PARA_STYLES:
+            self.add_paragraph(element, doc, p_style_name, p_level, text)
         else:
             # Text style names can, and will have, not only default values but user values too
             # hence we treat all other labels as pure text
-            level = self.get_level()
-            doc.add_text(
-                label=DocItemLabel.PARAGRAPH, parent=self.parents[level - 1], text=text
-            )
+            self.add_paragraph(element, doc, p_style_name, p_level, text)
 
         self.update_history(p_style_name, p_level, numid, ilevel)
+        self.handle_inline_pictures(element, doc)
         return
 
-    def add_header(self, element, docx_obj, doc, curr_name, curr_level, text: str):
-        level = self.get_level()
+    def add_title(self, element, doc, curr_name, curr_level, text: str):
+        self.parents[:] = [None] * len(self.parents)
+        self.parents[0] = doc.add_text(parent=None, label=_LABEL_TITLE, text=text)
+        self._current_level = 1
+        return
+
+    def add_paragraph(self, element, doc, curr_name, curr_level, text: str):
+        level = self._current_level
+        doc.add_text(label=_LABEL_PARAGRAPH, parent=self.parents[level - 1], text=text)
+        return
+
+    def add_header(self, element, doc, curr_name, curr_level, text: str):
+        level = self._current_level
         if isinstance(curr_level, int):
+            # Headings too deep for the parents list are nested one above its last
+            # level, which stays free for a list below the deepest heading. The
+            # heading itself keeps its level.
+            depth = min(max(curr_level, 0), self.max_levels - 2)
 
-            if curr_level > level:
+            if depth > level:
 
                 # add invisible group
-                for i in range(level, curr_level):
+                for i in range(level, depth):
                     self.parents[i] = doc.add_group(
                         parent=self.parents[i - 1],
-                        label=GroupLabel.SECTION,
+                        label=_GROUP_SECTION,
                         name=f"header-{i}",
                     )
 
-            elif curr_level < level:
+            elif depth < level:
 
                 # remove the tail
-                for key, val in self.parents.items():
-                    if key >= curr_level:
-                        self.parents[key] = None
+                self.parents[depth:] = [None] * (len(self.parents) - depth)
 
-            self.parents[curr_level] = doc.add_heading(
-                parent=self.parents[curr_level - 1],
+            self.parents[depth] = doc.add_heading(
+                parent=self.parents[depth - 1],
                 text=text,
                 level=curr_level,
             )
+            self._current_level = depth + 1
 
         else:
             self.parents[self.level] = doc.add_heading(
@@ -323,12 +456,19 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
                 text=text,
                 level=1,
             )
+            if self.level == level:
+                self._current_level = level + 1
         return
 
+    def get_list_depth(self, ilevel):
+        # Parents level of a list item, list levels which do not fit in the
+        # parents list are nested at its last level
+        depth = self.level_at_new_list + max(ilevel, 0)  # type: ignore
+        return min(depth, self.max_levels - 1)
+
     def add_listitem(
         self,
         element,
-        docx_obj,
         doc,
         p_style_name,
         p_level,
@@ -340,13 +480,16 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
         # is_numbered = is_numbered
         enum_marker = ""
 
-        level = self.get_level()
-        if self.prev_numid() is None:  # Open new list
+        level = self._current_level
+        if self._prev_numid is None:  # Open new list
+            # Headings stop one above the last level, so the list fits below them
+            level = min(level, self.max_levels - 1)
             self.level_at_new_list = level  # type: ignore
 
             self.parents[level] = doc.add_group(
-                label=GroupLabel.LIST, name="list", parent=self.parents[level - 1]
+                label=_GROUP_LIST, name="list", parent=self.parents[level - 1]
             )
+            self._current_level = level + 1
 
             # TODO: Set marker and enumerated arguments if this is an enumeration element.
             self.listIter += 1
@@ -361,25 +504,26 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
             )
 
         elif (
-            self.prev_numid() == numid and self.prev_indent() < ilevel
+            self._prev_numid == numid and self._prev_indent < ilevel
         ):  # Open indented list
-            for i in range(
-                self.level_at_new_list + self.prev_indent() + 1,
-                self.level_at_new_list + ilevel + 1,
-            ):
+            start = self.get_list_depth(self._prev_indent) + 1
+            end = self.get_list_depth(ilevel) + 1
+            for i in range(start, end):
                 # TODO: determine if this is an unordered list or an ordered list.
                 #  Set GroupLabel.ORDERED_LIST when it fits.
                 self.listIter = 0
                 if is_numbered:
                     self.parents[i] = doc.add_group(
-                        label=GroupLabel.ORDERED_LIST,
+                        label=_GROUP_ORDERED_LIST,
                         name="list",
                         parent=self.parents[i - 1],
                     )
                 else:
                     self.parents[i] = doc.add_group(
-                        label=GroupLabel.LIST, name="list", parent=self.parents[i - 1]
+                        label=_GROUP_LIST, name="list", parent=self.parents[i - 1]
                     )
+            if start <= level < end:
+                self._current_level = end
 
             # TODO: Set marker and enumerated arguments if this is an enumeration element.
             self.listIter += 1
@@ -389,14 +533,14 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
             doc.add_list_item(
                 marker=enum_marker,
                 enumerated=is_numbered,
-                parent=self.parents[self.level_at_new_list + ilevel],
+                parent=self.parents[self.get_list_depth(ilevel)],
                 text=text,
             )
 
-        elif self.prev_numid() == numid and ilevel < self.prev_indent():  # Close list
-            for k, v in self.parents.items():
-                if k > self.level_at_new_list + ilevel:
-                    self.parents[k] = None
+        elif self._prev_numid == numid and ilevel < self._prev_indent:  # Close list
+            tail = self.get_list_depth(ilevel) + 1
+            self.parents[tail:] = [None] * (len(self.parents) - tail)
+            self._current_level = min(self._current_level, tail)
 
             # TODO: Set marker and enumerated arguments if this is an enumeration element.
             self.listIter += 1
@@ -406,12 +550,12 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
             doc.add_list_item(
                 marker=enum_marker,
                 enumerated=is_numbered,
-                parent=self.parents[self.level_at_new_list + ilevel],
+                parent=self.parents[self.get_list_depth(ilevel)],
                 text=text,
             )
             self.listIter = 0
 
-        elif self.prev_numid() == numid or self.prev_indent() == ilevel:
+        elif self._prev_numid == numid or self._prev_indent == ilevel:
             # TODO: Set marker and enumerated arguments if this is an enumeration element.
             self.listIter += 1
             if is_numbered:
@@ -425,72 +569,81 @@ class MsWordDocumentBackend(DeclarativeDocumentBackend):
             )
         return
 
-    def handle_tables(self, element, docx_obj, doc):
-
-        # Function to check if a cell has a colspan (gridSpan)
-        def get_colspan(cell):
-            grid_span = cell._element.xpath("@w:gridSpan")
-            if grid_span:
-                return int(grid_span[0])  # Return the number of columns spanned
-            return 1  # Default is 1 (no colspan)
-
-        # Function to check if a cell has a rowspan (vMerge)
-        def get_rowspan(cell):
-            v_merge = cell._element.xpath("@w:vMerge")
-            if v_merge:
-                return v_merge[
-                    0
-                ]  # 'restart' indicates the beginning of a rowspan, others are continuation
-            return 1
-
-        table = docx.table.Table(element, docx_obj)
-
-        num_rows = len(table.rows)
+    def handle_tables(self, element, doc):
+
+        # Function to read the colspan (gridSpan) and vertical merge (vMerge) of a cell
+        def get_spans(tc):
+            tc_pr = tc.find(_TCPR_TAG)
+            if tc_pr is None:
+                return 1, None
+            grid_span = tc_pr.find(_GRIDSPAN_TAG)
+            v_merge = tc_pr.find(_VMERGE_TAG)
+            col_span = 1
+            if grid_span is not None:
+                col_span = self.str_to_int(grid_span.get(_XML_KEY), default=1) or 1
+            if v_merge is None:
+                return col_span, None
+            # 'restart' begins a vertical merge, a missing value continues it
+            return col_span, v_merge.get(_XML_KEY, "continue")
+
+        # Vertically merged cells keep a w:tc in every row they cover, so each
+        # w:tc only occupies its own row and starts where the previous one ends.
+        # The table is sized while it is filled, so each w:tc is read only once.
+        num_rows = 0
         num_cols = 0
-        for row in table.rows:
-            # Calculate the max number of columns
-            num_cols = max(num_cols, sum(get_colspan(cell) for cell in row.cells))
-            # if row.cells:
-            #     num_cols = max(num_cols, len(row.cells))
-
-        # Initialize the table grid
-        table_grid = [[None for _ in range(num_cols)] for _ in range(num_rows)]
+        table_cells = []
 
-        data = TableData(num_rows=num_rows, num_cols=num_cols, table_cells=[])
+        # Cells which begin a vertical merge, by start column
+        merged_cells = {}  # type: ignore
 
-        for row_idx, row in enumerate(table.rows):
+        for row_idx, tr in enumerate(element.iterfind(_TR_TAG)):
+            num_rows += 1
             col_idx = 0
-            for c, cell in enumerate(row.cells):
-                row_span = get_rowspan(cell)
-                col_span = get_colspan(cell)
-
-                # Find the next available column in the grid
-                while table_grid[row_idx][col_idx] is not None:
-                    col_idx += 1
-
-                # Fill the grid with the cell value, considering rowspan and colspan
-                for i in range(row_span if row_span == "restart" else 1):
-                    for j in range(col_span):
-                        table_grid[row_idx + i][col_idx + j] = ""
+            for tc in tr.iterfind(_TC_TAG):
+                col_span, v_merge = get_spans(tc)
+                start_col = col_idx
+                col_idx += col_span
+
+                if v_merge == "continue" and start_col in merged_cells:
+                    # Extend the cell above instead of adding an empty one
+                    cell = merged_cells[start_col]
+                    cell.row_span += 1
+                    cell.end_row_offset_idx += 1
+                    continue
 
                 cell = TableCell(
-                    text=cell.text,
-                    row_span=row_span,
+                    text="\n".join(
+                        self.get_paragraph_text(p) for p in tc.iterfind(_P_TAG)
+                    ),
+                    row_span=1,
                     col_span=col_span,
                     start_row_offset_idx=row_idx,
-                    end_row_offset_idx=row_idx + row_span,
-                    start_col_offset_idx=col_idx,
-                    end_col_offset_idx=col_idx + col_span,
+                    end_row_offset_idx=row_idx + 1,
+                    start_col_offset_idx=start_col,
+                    end_col_offset_idx=col_idx,
                     col_header=False,  # col_header,
                     row_header=False,  # ((not col_header) and html_cell.name=='th')
                 )
 
-                data.table_cells.append(cell)
+                table_cells.append(cell)
+                if v_merge == "restart":
+                    merged_cells[start_col] = cell
+                else:
+                    merged_cells.pop(start_col, None)
+            num_cols = max(num_cols, col_idx)
+
+        data = TableData(num_rows=num_rows, num_cols=num_cols, table_cells=table_cells)
 
-        level = self.get_level()
+        level = self._current_level
         doc.add_table(data=data, parent=self.parents[level - 1])
         return
 
-    def handle_pictures(self, element, docx_obj, doc):
-        doc.add_picture(parent=self.parents[self.level], caption=None)
+    def handle_inline_pictures(self, element, doc):
+        # Check for Inline Images (drawings or VML pictures)
+        for _ in _PICTURE_XP(element):
+            self.handle_pictures(element, doc)
+
+    def handle_pictures(self, element, doc):
+        level = self._current_level
+        doc.add_picture(parent=self.parents[level - 1], caption=None)
         return
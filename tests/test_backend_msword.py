@@ -8,6 +8,7 @@ from docling.datamodel.document import (
     ConversionResult,
     InputDocument,
     SectionHeaderItem,
+    TextItem,
 )
 from docling.document_converter import DocumentConverter
 
@@ -39,6 +40,38 @@ def test_heading_levels():
     assert found_lvl_1 and found_lvl_2
 
 
+def test_deep_heading_levels():
+    in_path = Path("tests/data/docx/unit_test_deep_headings.docx")
+    in_doc = InputDocument(
+        path_or_stream=in_path,
+        format=InputFormat.DOCX,
+        backend=MsWordDocumentBackend,
+    )
+    backend = MsWordDocumentBackend(
+        in_doc=in_doc,
+        path_or_stream=in_path,
+    )
+    doc = backend.convert()
+
+    # Headings deeper than max_levels keep their own level, deep list items are kept
+    items = {
+        item.text: item for item, _ in doc.iterate_items() if isinstance(item, TextItem)
+    }
+    assert items["Heading at level 25"].level == 25
+    assert items["Heading at level 20"].level == 20
+    assert "Item at level 25" in items
+
+    # Text and lists below the deepest heading stay inside its section
+    deep_heading = items["Heading at level 25"]
+    for text in (
+        "Text under the level 25 heading.",
+        "Text after the list under the level 25 heading.",
+    ):
+        assert items[text].parent.resolve(doc) is deep_heading
+    deep_list = items["Item under the level 25 heading"].parent.resolve(doc)
+    assert deep_list.parent.resolve(doc) is deep_heading
+
+
 def get_docx_paths():
 
     # Define the directory you want to search